@@ -2,12 +2,112 @@
 # https://github.com/Tasm-Devil/lufft-python
 
 from asyncore import write
-import time
 import struct
+import binascii
+import functools
 
 class UMBError(BaseException):
     pass
 
+# precompiled packers, so the format strings are parsed once at import
+_S_B = struct.Struct('<B')
+_S_b = struct.Struct('<b')
+_S_H = struct.Struct('<H')
+_S_h = struct.Struct('<h')
+_S_L = struct.Struct('<L')
+_S_l = struct.Struct('<l')
+_S_f = struct.Struct('<f')
+_S_d = struct.Struct('<d')
+_S_prefix = struct.Struct('<6B')  # SOH, VERSION, TO, TO_CLASS, FROM, FROM_CLASS
+_S_command = struct.Struct('<4B')  # LEN, STX, COMMAND, COMMAND_VERSION
+_S_rx_header = struct.Struct('<10B')  # SOH, VERSION, FROM, FROM_CLASS, TO, TO_CLASS, LEN, STX, COMMAND, COMMAND_VERSION
+_S_crc = struct.Struct('<HB')  # checksum followed by EOT
+
+@functools.lru_cache(maxsize=32)
+def _channels_struct(n):
+    '''Struct for LEN, STX, COMMAND, COMMAND_VERSION, NUMBER and n channels of a one call request'''
+    return struct.Struct('<5B%dH' % n)
+
+# UMB data type -> Struct decoding the measurement value (Struct.size is its length in bytes)
+_TYPE_MAP = {
+    16: _S_B,  # UNSIGNED_CHAR
+    17: _S_b,  # SIGNED_CHAR
+    18: _S_H,  # UNSIGNED_SHORT
+    19: _S_h,  # SIGNED_SHORT
+    20: _S_L,  # UNSIGNED_LONG
+    21: _S_l,  # SIGNED_LONG
+    22: _S_f,  # FLOAT
+    23: _S_d,  # DOUBLE
+}
+
+# the same mapping indexed directly by the type byte (None for unknown types), so decoding needs no dict lookup
+_DECODERS = tuple(_TYPE_MAP.get(type_of_value) for type_of_value in range(256))
+
+@functools.lru_cache(maxsize=32)
+def _batch_struct(value_format, n_channels, stride):
+    '''Struct decoding n_channels equally typed values spaced stride bytes apart in one call'''
+    value = value_format[-1]
+    pad = stride - struct.calcsize(value_format)
+    return struct.Struct('<' + ('%s%dx' % (value, pad)) * (n_channels - 1) + value)
+
+def _parse_one_call_response(rx_frame, n_channels):
+    '''Decode the (values, statuses) lists from a validated one call response frame.
+    Each channel block starts at offset with SUB_LEN, followed by status, channel (2 bytes),
+    type and the value itself; the next block starts SUB_LEN + 1 bytes later.
+    A reply with a non-zero overall status carries no channel blocks, then every channel
+    gets that status and the value 0.'''
+    status = rx_frame[10]
+    if status != 0:
+        return [0] * n_channels, [status] * n_channels
+    # index of ETX, no channel block may reach beyond it
+    payload_end = 8 + rx_frame[6]
+
+    # fast path: all channels answered with the same type and block length (e.g. all FLOAT),
+    # taken only when the first block header is inside the payload and all blocks fit before ETX
+    if n_channels and payload_end > 16:
+        sub_len = rx_frame[12]
+        type_of_value = rx_frame[16]
+        decoder = _DECODERS[type_of_value]
+        stride = sub_len + 1
+        end = 12 + stride * n_channels
+        if (decoder is not None and sub_len == decoder.size + 4 and end <= payload_end
+                and rx_frame[12:end:stride].count(sub_len) == n_channels
+                and rx_frame[16:end:stride].count(type_of_value) == n_channels):
+            values = list(_batch_struct(decoder.format, n_channels, stride).unpack_from(rx_frame, 17))
+            return values, list(rx_frame[13:end:stride])
+
+    values = []
+    statuses = []
+    offset = 12
+
+    for i in range(n_channels):
+        if offset >= payload_end or offset + rx_frame[offset] + 1 > payload_end:
+            raise UMBError("RX-Error! Channel block " + str(i) + " exceeds the payload. length-field says: " + str(rx_frame[6]))
+        sub_len = rx_frame[offset]
+        # blocks of channels in error may end after status and channel, without type and value
+        decoder = _DECODERS[rx_frame[offset + 4]] if sub_len >= 4 else None
+        if decoder is not None and sub_len >= decoder.size + 4:
+            values.append(decoder.unpack_from(rx_frame, offset + 5)[0])
+        else:
+            values.append(0)
+        statuses.append(rx_frame[offset + 1])
+        offset += sub_len + 1
+
+    return values, statuses
+
+# bit-reversed value of every byte, used to map the reflected UMB CRC onto binascii.crc_hqx
+_REV8 = bytes(int('{:08b}'.format(i)[::-1], 2) for i in range(256))
+
+def crc16_umb(data, crc=0xFFFF, start=0, stop=None):
+    '''Calculate the UMB CRC16 (CRC-CCITT reflected, as X.25 without final XOR) of data[start:stop].
+    The reflected CRC equals the bit-reversed non-reflected CRC over bit-reversed bytes,
+    so the byte loop runs in C inside binascii.crc_hqx. Pass the previous result as crc
+    to continue a checksum over several chunks.'''
+    # translate() copies anyway, so take the start:stop range from its result without another copy
+    reflected = memoryview(bytes(data).translate(_REV8))[start:stop]
+    crc = binascii.crc_hqx(reflected, (_REV8[crc & 0xFF] << 8) | _REV8[crc >> 8])
+    return (_REV8[crc & 0xFF] << 8) | _REV8[crc >> 8]
+
 class WS_UMB:
     """
     This is a simple driver for communicating to Weatherstations
@@ -85,6 +185,44 @@ class WS_UMB:
         ./WS_UMB.py 100 111 200 300 460 580
     """
 
+    # UMB frame constants
+    SOH, STX, ETX, EOT = 0x01, 0x02, 0x03, 0x04
+    VERSION = 0x10
+    TO_CLASS = 0x70
+    FROM = 0x01
+    FROM_CLASS = 0xF0
+
+    # status code -> description, see checkStatus()
+    _STATUS_MESSAGES = {
+        0: "Status: Command successful; no error; all OK",
+        16: "Status: Unknown command; not supported by this device",
+        17: "Status: Invalid parameter",
+        18: "Status: Invalid header version",
+        19: "Status: Invalid version of the command",
+        20: "Status: Invalid password for command",
+        32: "Status: Read error",
+        33: "Status: Write errorr",
+        34: "Status: Length too great; max. permissible length is designated in <maxlength>",
+        35: "Status: Invalid address / storage location",
+        36: "Status: Invalid channel",
+        37: "Status: Command not possible in this mode",
+        38: "Status: Unknown calibration command",
+        39: "Status: Calibration error",
+        40: "Status: Device not ready; e.g. initialization / calibrationrunning",
+        41: "Status: Under-voltage",
+        42: "Status: Hardware error",
+        43: "Status: Measurement error",
+        44: "Status: Error on device initialization",
+        45: "Status: Error in operating system",
+        48: "Status: Configuration error, default configuration was loaded",
+        49: "Status: Calibration error / the calibration is invalid, measurement not possible",
+        50: "Status: CRC error on loading configuration; defaultconfiguration was loaded",
+        51: "Status: CRC error on loading calibration; measurement not possible",
+        52: "Status: Calibration Step 1",
+        53: "Status: Calibration OK",
+        54: "Status: Channel deactivated",
+    }
+
     #def __init__(self, device='COM3', baudrate=19200):
     #    self.device = device
     #    self.baudrate = baudrate
@@ -101,20 +239,77 @@ class WS_UMB:
     #def __exit__(self, exception_type, exception_value, traceback):
     #    self.serial.close()
     
+    @staticmethod
+    @functools.lru_cache(maxsize=8)
+    def _header_for(receiver_id):
+        '''Frame prefix up to (not including) LEN for requests to receiver_id'''
+        return _S_prefix.pack(WS_UMB.SOH, WS_UMB.VERSION, receiver_id, WS_UMB.TO_CLASS, WS_UMB.FROM, WS_UMB.FROM_CLASS)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=32)
+    def _expected_rx_header(receiver_id, command, command_version, length):
+        '''First 10 bytes of a valid response from receiver_id to command with a LEN field of length'''
+        return _S_rx_header.pack(WS_UMB.SOH, WS_UMB.VERSION, WS_UMB.FROM, WS_UMB.FROM_CLASS, receiver_id, WS_UMB.TO_CLASS,
+                                 length, WS_UMB.STX, command, command_version)
+
     def readFromSerial(self, timeout=1):
-        timeout_count = 0
-        data = b''
+        '''Read from serial until no new byte arrives within timeout seconds'''
+        # let pyserial block in the OS until data arrives instead of polling inWaiting()
+        self.serial.timeout = timeout
+        data = bytearray()
         while True:
-            if self.serial.inWaiting() > 0:
-                new_data = self.serial.read(1)
-                data = data + new_data
-                timeout_count = 0
-            else:
-                timeout_count += 1
-                if timeout is not None and timeout_count >= 10 * timeout:
-                    break
-                time.sleep(0.01)
-        return data
+            new_data = self.serial.read(self.serial.in_waiting or 1)
+            if not new_data:
+                break
+            data += new_data
+        return bytes(data)
+
+    def _read_frame(self, timeout=1):
+        '''Read exactly one UMB frame from serial using its length field'''
+        self.serial.timeout = timeout
+        # SOH, VERSION, TO, TO_CLASS, FROM, FROM_CLASS, LEN, STX
+        head = self.serial.read(8)
+        if len(head) < 8:
+            raise UMBError("RX-Error! Timeout while reading frame header. Received: " + str(head))
+        # LEN bytes (command, version, payload) followed by ETX, CRC (2 bytes) and EOT
+        tail = self.serial.read(head[6] + 4)
+        if len(tail) < head[6] + 4:
+            raise UMBError("RX-Error! Timeout while reading frame payload. Received: " + str(head + tail))
+        return head + tail
+
+    def _check_rx_frame(self, rx_frame, receiver_id, command, command_version):
+        '''Validate checksum, length and header fields of a response frame, raise UMBError otherwise'''
+        # compare checksum field to calculated checksum
+        cs_calculated = self.calc_crc16(rx_frame, stop=-3).to_bytes(2, 'little')
+        cs_received = rx_frame[-3:-1]
+        if (cs_calculated != cs_received):
+            raise UMBError("RX-Error! Checksum test failed. Calculated Checksum: " + str(cs_calculated) + "| Received Checksum: " + str(cs_received))
+        
+        # Check the length of the frame: 8 header bytes, ETX, CRC (2 bytes) and EOT at least
+        if (len(rx_frame) < 12):
+            raise UMBError("RX-Error! Frame too short. Received " + str(len(rx_frame)) + " bytes")
+        length = rx_frame[6]
+        # command, command version and status are always present
+        if (length < 3 or len(rx_frame) <= 8 + length or rx_frame[8 + length] != self.ETX):
+            raise UMBError("RX-Error! Length of Payload is not valid. length-field says: " + str(length))
+        
+        # Check if all frame field are valid: bytes 0..9 are fully determined by the request
+        if (rx_frame[:10] != self._expected_rx_header(receiver_id, command, command_version, length)):
+            # find the offending field for the error message
+            if (rx_frame[0] != self.SOH):
+                raise UMBError("RX-Error! No Start-of-frame Character")
+            if (rx_frame[1] != self.VERSION):
+                raise UMBError("RX-Error! Wrong Version Number")
+            if (rx_frame[2] != self.FROM or rx_frame[3] != self.FROM_CLASS):
+                raise UMBError("RX-Error! Wrong Destination ID")
+            if (rx_frame[4] != receiver_id or rx_frame[5] != self.TO_CLASS):
+                raise UMBError("RX-Error! Wrong Source ID")
+            if (rx_frame[7] != self.STX):
+                raise UMBError("RX-Error! Missing STX field")
+            if (rx_frame[8] != command):
+                raise UMBError("RX-Error! Wrong Command Number")
+            if (rx_frame[9] != command_version):
+                raise UMBError("RX-Error! Wrong Command Version Number")
 
     def calc_next_crc_byte(self, crc_buff, nextbyte):
         for i in range (8):
@@ -127,43 +322,21 @@ class WS_UMB:
             nextbyte = nextbyte >> 1;
         return(crc_buff);
     
-    def calc_crc16(self, data):
-        crc = 0xFFFF;
-        for byte in data:
-            crc = self.calc_next_crc_byte(crc, byte);
-        return crc
-
-    def send_request_one_call_multi(self, receiver_id, command, command_version, channels):
-        
-        SOH, STX, ETX, EOT= b'\x01', b'\x02', b'\x03', b'\x04'
-        VERSION = b'\x10'
+    def calc_crc16(self, data, start=0, stop=None):
+        return crc16_umb(data, start=start, stop=stop)
 
-        TO = int(receiver_id).to_bytes(1,'little')
-        TO_CLASS = b'\x70'
-        FROM = int(1).to_bytes(1,'little')
-        FROM_CLASS = b'\xF0'
-        
-        LEN = 3
-        channel_len = len(channels)
-        NUMBER = int(channel_len).to_bytes(1,'little')
-
-        FULLPAYLOAD = NUMBER
-        for channel in channels:
-            as_byte = int(channel).to_bytes(2,'little')
-            FULLPAYLOAD += as_byte
-            for byte in as_byte:
-                LEN += 1
-
-        LEN = int(LEN).to_bytes(1,'little')
-        
-        COMMAND = int(command).to_bytes(1,'little')
-        COMMAND_VERSION = int(command_version).to_bytes(1,'little')
+    def _finalize(self, header, payload):
+        '''Assemble header + payload + ETX and append checksum and EOT'''
+        tx_frame = header + payload + bytes((self.ETX,))
+        return tx_frame + _S_crc.pack(self.calc_crc16(tx_frame), self.EOT)
 
-        # Assemble transmit-frame
-        tx_frame = SOH + VERSION + TO + TO_CLASS + FROM + FROM_CLASS + LEN + STX + COMMAND + COMMAND_VERSION + FULLPAYLOAD + ETX
+    def send_request_one_call_multi(self, receiver_id, command, command_version, channels):
+        '''Send a one call request for channels; receiver_id, command, command_version and channels must be ints'''
 
-        # calculate checksum for trasmit-frame and concatenate
-        tx_frame += self.calc_crc16(tx_frame).to_bytes(2, 'little') + EOT
+        # Assemble transmit-frame: LEN, STX, command and payload (number of channels + channels) in one pack
+        n = len(channels)
+        payload = _channels_struct(n).pack(3 + 2 * n, self.STX, command, command_version, n, *channels)
+        tx_frame = self._finalize(self._header_for(receiver_id), payload)
 
         # Write transmit-frame to serial
         self.writeCallback(tx_frame)
@@ -174,97 +347,20 @@ class WS_UMB:
         
         # Read frame from serial
         rx_frame = self.readCallback()
-        #rx_frame = self.readFromSerial()
+        #rx_frame = self._read_frame()
         #print("one call response: " + str(rx_frame))
         #print([hex(c) for c in rx_frame])
         
-        # compare checksum field to calculated checksum
-        cs_calculated = self.calc_crc16(rx_frame[:-3]).to_bytes(2, 'little')
-        cs_received = rx_frame[-3:-1]
-        if (cs_calculated != cs_received):
-            raise UMBError("RX-Error! Checksum test failed. Calculated Checksum: " + str(cs_calculated) + "| Received Checksum: " + str(cs_received))
-        
-        # Check the length of the frame
-        length = int.from_bytes(rx_frame[6:7], byteorder='little')
-        if (rx_frame[8+length:9+length] != ETX):
-            raise UMBError("RX-Error! Length of Payload is not valid. length-field says: " + str(length))
-        
-        # Check if all frame field are valid
-        if (rx_frame[0:1] != SOH):
-            raise UMBError("RX-Error! No Start-of-frame Character")
-        if (rx_frame[1:2] != VERSION):
-            raise UMBError("RX-Error! Wrong Version Number")
-        if (rx_frame[2:4] != (FROM + FROM_CLASS)):
-            raise UMBError("RX-Error! Wrong Destination ID")
-        if (rx_frame[4:6] != (TO + TO_CLASS)):
-            raise UMBError("RX-Error! Wrong Source ID")
-        if (rx_frame[7:8] != STX):
-            raise UMBError("RX-Error! Missing STX field")
-        if (rx_frame[8:9] != COMMAND):
-            raise UMBError("RX-Error! Wrong Command Number")
-        if (rx_frame[9:10] != COMMAND_VERSION):
-            raise UMBError("RX-Error! Wrong Command Version Number")
+        self._check_rx_frame(rx_frame, receiver_id, command, command_version)
             
-        values = []
-        statuses = []
-        index = 16
-        parse_index = 17
-
-        for i in range(len(channels)):
-            #status = int.from_bytes(rx_frame[10:11], byteorder='little')
-            status = int.from_bytes(rx_frame[index - 3: (index + 1) - 3], byteorder='little')
-            type_of_value = int.from_bytes(rx_frame[index:index + 1], byteorder='little')
-            sub_len = int.from_bytes(rx_frame[index - 4: (index + 1) - 4], byteorder='little')
-            #print(sub_len)
-            #print(status)
-
-            index += sub_len + 1
-            
-            value = 0
-            if type_of_value == 16:     # UNSIGNED_CHAR
-                value = struct.unpack('<B', rx_frame[parse_index:parse_index + 1])[0]
-            elif type_of_value == 17:   # SIGNED_CHAR
-                value = struct.unpack('<b', rx_frame[parse_index:parse_index + 1])[0]
-            elif type_of_value == 18:   # UNSIGNED_SHORT
-                value = struct.unpack('<H', rx_frame[parse_index:parse_index + 2])[0]
-            elif type_of_value == 19:   # SIGNED_SHORT
-                value = struct.unpack('<h', rx_frame[parse_index:parse_index + 2])[0]
-            elif type_of_value == 20:   # UNSIGNED_LONG
-                value = struct.unpack('<L', rx_frame[parse_index:parse_index + 4])[0]
-            elif type_of_value == 21:   # SIGNED_LONG
-                value = struct.unpack('<l', rx_frame[parse_index:parse_index + 4])[0]
-            elif type_of_value == 22:   # FLOAT
-                value = struct.unpack('<f', rx_frame[parse_index:parse_index + 4])[0]
-            elif type_of_value == 23:   # DOUBLE
-                value = struct.unpack('<d', rx_frame[parse_index:parse_index + 8])[0]
-
-            parse_index += sub_len + 1
-            values.append(value)
-            statuses.append(status)
-
-        return values, statuses
+        return _parse_one_call_response(rx_frame, len(channels))
     
     def send_request(self, receiver_id, command, command_version, payload):
-        
-        SOH, STX, ETX, EOT= b'\x01', b'\x02', b'\x03', b'\x04'
-        VERSION = b'\x10'
-        TO = int(receiver_id).to_bytes(1,'little')
-        TO_CLASS = b'\x70'
-        FROM = int(1).to_bytes(1,'little')
-        FROM_CLASS = b'\xF0'
-        
-        LEN = 2
-        for payload_byte in payload:
-            LEN += 1
-        LEN = int(LEN).to_bytes(1,'little')
-        
-        COMMAND = int(command).to_bytes(1,'little')
-        COMMAND_VERSION = int(command_version).to_bytes(1,'little')
+        '''Send a request with a bytes payload; receiver_id, command and command_version must be ints'''
         
         # Assemble transmit-frame
-        tx_frame = SOH + VERSION + TO + TO_CLASS + FROM + FROM_CLASS + LEN + STX + COMMAND + COMMAND_VERSION + payload + ETX
-        # calculate checksum for trasmit-frame and concatenate
-        tx_frame += self.calc_crc16(tx_frame).to_bytes(2, 'little') + EOT
+        header = self._header_for(receiver_id) + _S_command.pack(2 + len(payload), self.STX, command, command_version)
+        tx_frame = self._finalize(header, payload)
         
         # Write transmit-frame to serial
         self.writeCallback(tx_frame)
@@ -275,127 +371,40 @@ class WS_UMB:
         
         # Read frame from serial
         rx_frame = self.readCallback()
-        #rx_frame = self.readFromSerial()
+        #rx_frame = self._read_frame()
         #print("single channel response: " + str(rx_frame))
         #print([hex(c) for c in rx_frame])
         
-        # compare checksum field to calculated checksum
-        cs_calculated = self.calc_crc16(rx_frame[:-3]).to_bytes(2, 'little')
-        cs_received = rx_frame[-3:-1]
-        if (cs_calculated != cs_received):
-            raise UMBError("RX-Error! Checksum test failed. Calculated Checksum: " + str(cs_calculated) + "| Received Checksum: " + str(cs_received))
-        
-        # Check the length of the frame
-        length = int.from_bytes(rx_frame[6:7], byteorder='little')
-        if (rx_frame[8+length:9+length] != ETX):
-            raise UMBError("RX-Error! Length of Payload is not valid. length-field says: " + str(length))
-        
-        # Check if all frame field are valid
-        if (rx_frame[0:1] != SOH):
-            raise UMBError("RX-Error! No Start-of-frame Character")
-        if (rx_frame[1:2] != VERSION):
-            raise UMBError("RX-Error! Wrong Version Number")
-        if (rx_frame[2:4] != (FROM + FROM_CLASS)):
-            raise UMBError("RX-Error! Wrong Destination ID")
-        if (rx_frame[4:6] != (TO + TO_CLASS)):
-            raise UMBError("RX-Error! Wrong Source ID")
-        if (rx_frame[7:8] != STX):
-            raise UMBError("RX-Error! Missing STX field")
-        if (rx_frame[8:9] != COMMAND):
-            raise UMBError("RX-Error! Wrong Command Number")
-        if (rx_frame[9:10] != COMMAND_VERSION):
-            raise UMBError("RX-Error! Wrong Command Version Number")
+        self._check_rx_frame(rx_frame, receiver_id, command, command_version)
             
-        status = int.from_bytes(rx_frame[10:11], byteorder='little')
-        type_of_value = int.from_bytes(rx_frame[13:14], byteorder='little')     
+        status = rx_frame[10]
+        length = rx_frame[6]
         value = 0
-        #print("work: type_of_value: " + str(type_of_value))
-        #print("work: status: " + str(status))
         
-        if type_of_value == 16:     # UNSIGNED_CHAR
-            value = struct.unpack('<B', rx_frame[14:15])[0]
-        elif type_of_value == 17:   # SIGNED_CHAR
-            value = struct.unpack('<b', rx_frame[14:15])[0]
-        elif type_of_value == 18:   # UNSIGNED_SHORT
-            value = struct.unpack('<H', rx_frame[14:16])[0]
-        elif type_of_value == 19:   # SIGNED_SHORT
-            value = struct.unpack('<h', rx_frame[14:16])[0]
-        elif type_of_value == 20:   # UNSIGNED_LONG
-            value = struct.unpack('<L', rx_frame[14:18])[0]
-        elif type_of_value == 21:   # SIGNED_LONG
-            value = struct.unpack('<l', rx_frame[14:18])[0]
-        elif type_of_value == 22:   # FLOAT
-            value = struct.unpack('<f', rx_frame[14:18])[0]
-        elif type_of_value == 23:   # DOUBLE
-            value = struct.unpack('<d', rx_frame[14:22])[0]
+        # a status-only reply (LEN=3) carries no channel, type and value
+        if length >= 6:
+            type_of_value = rx_frame[13]
+            #print("work: type_of_value: " + str(type_of_value))
+            #print("work: status: " + str(status))
+            decoder = _DECODERS[type_of_value]
+            if decoder is not None and 14 + decoder.size <= 8 + length:
+                value = decoder.unpack_from(rx_frame, 14)[0]
         
         return (value, status)
     
     def checkStatus(self, status):
         '''Check status code'''
-        if status == 0:
-            return ("Status: Command successful; no error; all OK")
-        elif status == 16:
-            return ("Status: Unknown command; not supported by this device")
-        elif status == 17:
-            return ("Status: Invalid parameter")
-        elif status == 18:
-            return ("Status: Invalid header version")
-        elif status == 19:
-            return ("Status: Invalid version of the command")
-        elif status == 20:
-            return ("Status: Invalid password for command")
-        elif status == 32:
-            return ("Status: Read error")
-        elif status == 33:
-            return ("Status: Write errorr")
-        elif status == 34:
-            return ("Status: Length too great; max. permissible length is designated in <maxlength>")
-        elif status == 35:
-            return ("Status: Invalid address / storage location")
-        elif status == 36:
-            return ("Status: Invalid channel")
-        elif status == 37:
-            return ("Status: Command not possible in this mode")
-        elif status == 38:
-            return ("Status: Unknown calibration command")
-        elif status == 39:
-            return ("Status: Calibration error")
-        elif status == 40:
-            return ("Status: Device not ready; e.g. initialization / calibrationrunning")
-        elif status == 41:
-            return ("Status: Under-voltage")
-        elif status == 42:
-            return ("Status: Hardware error")
-        elif status == 43:
-            return ("Status: Measurement error")
-        elif status == 44:
-            return ("Status: Error on device initialization")
-        elif status == 45:
-            return ("Status: Error in operating system")
-        elif status == 48:
-            return ("Status: Configuration error, default configuration was loaded")
-        elif status == 49:
-            return ("Status: Calibration error / the calibration is invalid, measurement not possible")
-        elif status == 50:
-            return ("Status: CRC error on loading configuration; defaultconfiguration was loaded")
-        elif status == 51:
-            return ("Status: CRC error on loading calibration; measurement not possible")
-        elif status == 52:
-            return ("Status: Calibration Step 1")
-        elif status == 53:
-            return ("Status: Calibration OK")
-        elif status == 54:
-            return ("Status: Channel deactivated")
+        return self._STATUS_MESSAGES.get(status, "Status: unknown")
     
     def onlineDataQuery(self, channel, receiver_id=1):
         '''Query data from one channel'''
-        return self.send_request(receiver_id, 35, 16, int(channel).to_bytes(2,'little'))
+        return self.send_request(int(receiver_id), 35, 16, int(channel).to_bytes(2,'little'))
 
     def onlineDataQueryMulti(self, channels, receiver_id=1):
         '''Query data from multiple channels'''
         values = []
         statuses = []
+        receiver_id = int(receiver_id)
 
         for channel in channels:
             responses, responses2 = self.send_request(receiver_id, 35, 16, int(channel).to_bytes(2,'little'))
@@ -406,7 +415,7 @@ class WS_UMB:
 
     def onlineDataQueryMultiOneCall(self, channels, receiver_id=1):
         '''Query data from multiple channels in one call'''
-        return self.send_request_one_call_multi(receiver_id, 47, 16, channels)
+        return self.send_request_one_call_multi(int(receiver_id), 47, 16, [int(channel) for channel in channels])
 
 #dummy class for testing
 class WS_UMB_dummy:
@@ -27,10 +27,27 @@ def res():
 import socket
 s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
 
+def _recvn(sock, n):
+    '''receive exactly n bytes, recv() may return less than requested'''
+    buf = bytearray(n)
+    view = memoryview(buf)
+    received = 0
+    while received < n:
+        count = sock.recv_into(view[received:])
+        if count == 0:
+            raise ConnectionError("Connection closed after " + str(received) + " of " + str(n) + " bytes")
+        received += count
+    return bytes(buf)
+
+def recv_umb_frame(sock):
+    '''receive one complete UMB frame using its length field'''
+    head = _recvn(sock, 8)                  # SOH .. LEN, STX
+    tail = _recvn(sock, head[6] + 4)        # LEN bytes, ETX, CRC (2 bytes), EOT
+    return head + tail
+
 def rec():
     global s
-    received = s.recv(1024)
-    return received
+    return recv_umb_frame(s)
 
 def main():
 